@@ -163,8 +163,11 @@ class Section:
     @points.setter
     def points(self, value):
         """Set the points."""
+        # deferred to avoid a core -> features import cycle
+        from neurom.features import section  # pylint: disable=import-outside-toplevel
         self.morphio_section.points = np.copy(value[:, COLS.XYZ])
         self.morphio_section.diameters = np.copy(value[:, COLS.R]) * 2
+        section.invalidate_cache()
 
     @property
     def type(self):
@@ -183,7 +186,7 @@ class Section:
         The area is calculated from the segments, as defined by this
         section's points
         """
-        return sum(morphmath.segment_area(s) for s in iter_segments(self))
+        return morphmath.section_scalar_stats(self.points)[1]
 
     @property
     def volume(self):
@@ -192,7 +195,7 @@ class Section:
         The volume is calculated from the segments, as defined by this
         section's points
         """
-        return sum(morphmath.segment_volume(s) for s in iter_segments(self))
+        return morphmath.section_scalar_stats(self.points)[2]
 
     def __repr__(self):
         """Text representation."""
@@ -309,8 +312,8 @@ def iter_segments(obj, neurite_filter=None, neurite_order=NeuriteIter.FileOrder)
                                   neurite_order=neurite_order))
 
     return flatten(
-        zip(section.points[:-1], section.points[1:])
-        for section in sections
+        zip(pts[:-1], pts[1:])
+        for pts in (section.points for section in sections)
     )
 
 
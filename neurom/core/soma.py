@@ -138,8 +138,9 @@ class SomaCylinders(Soma):
     def __init__(self, morphio_soma):
         """Initialize a SomaCyliners object."""
         super().__init__(morphio_soma)
+        points = self.points
         self.area = sum(morphmath.segment_area((p0, p1))
-                        for p0, p1 in zip(self.points, self.points[1:]))
+                        for p0, p1 in zip(points, points[1:]))
         self.radius = math.sqrt(self.area / (4. * math.pi))
 
     @property
@@ -150,8 +151,9 @@ class SomaCylinders(Soma):
     @property
     def volume(self):
         """Return the volume of soma."""
+        points = self.points
         return sum(morphmath.segment_volume((p0, p1))
-                   for p0, p1 in zip(self.points, self.points[1:]))
+                   for p0, p1 in zip(points, points[1:]))
 
     def __str__(self):
         """Return a string representation."""
@@ -162,7 +164,8 @@ class SomaCylinders(Soma):
         """Check that the given points are located inside the soma."""
         points = np.atleast_2d(np.asarray(points, dtype=np.float64))
         mask = np.ones(len(points)).astype(bool)
-        for p1, p2 in zip(self.points[:-1], self.points[1:]):
+        soma_points = self.points
+        for p1, p2 in zip(soma_points[:-1], soma_points[1:]):
             vec = p2[COLS.XYZ] - p1[COLS.XYZ]
             vec_norm = np.linalg.norm(vec)
             dot = (points[mask] - p1[COLS.XYZ]).dot(vec) / vec_norm
@@ -112,13 +112,13 @@ def total_area(neurite):
 
     The area is defined as the sum of the area of the sections.
     """
-    return sum(_map_sections(sf.section_area, neurite))
+    return float(np.sum(sf.neurite_segment_features(neurite).section_areas))
 
 
 @feature(shape=())
 def total_volume(neurite):
     """Neurite volume. For a morphology it will be a sum of neurites volumes."""
-    return sum(_map_sections(sf.section_volume, neurite))
+    return float(np.sum(sf.neurite_segment_features(neurite).section_volumes))
 
 
 @feature(shape=(...,))
@@ -157,15 +157,26 @@ def section_term_branch_orders(neurite):
     return _map_sections(sf.branch_order, neurite, Section.ileaf)
 
 
+def _section_path_lengths(neurite):
+    """Path lengths from each section of `neurite` to the root, keyed by section id.
+
+    A single pre-order traversal fills the lengths with
+    ``path_length[section] = length[section] + path_length[parent]``, so every
+    section length is read once, instead of walking upstream and re-summing the
+    same ancestors for every queried section.
+    """
+    path_lengths = {}
+    for section in Section.ipreorder(neurite.root_node):
+        parent = section.parent
+        path_lengths[section.id] = float(section.length) + (
+            path_lengths[parent.id] if parent is not None else 0.0)
+    return path_lengths
+
+
 @feature(shape=(...,))
 def section_path_distances(neurite):
     """Path lengths."""
-
-    def pl2(node):
-        """Calculate the path length using cached section lengths."""
-        return sum(n.length for n in node.iupstream())
-
-    return _map_sections(pl2, neurite)
+    return list(_section_path_lengths(neurite).values())
 
 
 ################################################################################
@@ -188,25 +199,25 @@ def _map_segments(func, neurite):
 @feature(shape=(...,))
 def segment_lengths(neurite):
     """Lengths of the segments."""
-    return _map_segments(sf.segment_lengths, neurite)
+    return sf.neurite_segment_features(neurite).segment_lengths.tolist()
 
 
 @feature(shape=(...,))
 def segment_areas(neurite):
     """Areas of the segments."""
-    return _map_segments(sf.segment_areas, neurite)
+    return sf.neurite_segment_features(neurite).segment_areas.tolist()
 
 
 @feature(shape=(...,))
 def segment_volumes(neurite):
     """Volumes of the segments."""
-    return _map_segments(sf.segment_volumes, neurite)
+    return sf.neurite_segment_features(neurite).segment_volumes.tolist()
 
 
 @feature(shape=(...,))
 def segment_radii(neurite):
     """Arithmetic mean of the radii of the points in segments."""
-    return _map_segments(sf.segment_mean_radii, neurite)
+    return sf.neurite_segment_features(neurite).segment_mean_radii.tolist()
 
 
 @feature(shape=(...,))
@@ -237,7 +248,7 @@ def segment_meander_angles(neurite):
 @feature(shape=(..., 3))
 def segment_midpoints(neurite):
     """Return a list of segment mid-points."""
-    return _map_segments(sf.segment_midpoints, neurite)
+    return sf.neurite_segment_features(neurite).segment_midpoints.tolist()
 
 
 @feature(shape=(...,))
@@ -259,12 +270,12 @@ def segment_path_lengths(neurite):
 @feature(shape=(...,))
 def segment_radial_distances(neurite, origin=None):
     """Returns the list of distances between all segment mid points and origin."""
-    pos = neurite.root_node.points[0] if origin is None else origin
+    # coerce and slice the origin once instead of once per section
+    pos = np.asarray(neurite.root_node.points[0] if origin is None else origin)[COLS.XYZ]
 
     def radial_distances(section):
         """List of distances between the mid point of each segment and pos."""
-        mid_pts = 0.5 * (section.points[:-1, COLS.XYZ] + section.points[1:, COLS.XYZ])
-        return np.linalg.norm(mid_pts - pos[COLS.XYZ], axis=1)
+        return np.linalg.norm(sf.segment_midpoints(section) - pos, axis=1)
 
     return _map_segments(radial_distances, neurite)
 
@@ -401,7 +412,8 @@ def section_bif_radial_distances(neurite, origin=None):
 @feature(shape=(...,))
 def terminal_path_lengths(neurite):
     """Get the path lengths to each terminal point."""
-    return _map_sections(sf.section_path_length, neurite, Section.ileaf)
+    path_lengths = _section_path_lengths(neurite)
+    return [path_lengths[section.id] for section in Section.ileaf(neurite.root_node)]
 
 
 @feature(shape=())
@@ -423,13 +435,13 @@ def volume_density(neurite):
 @feature(shape=(...,))
 def section_volumes(neurite):
     """Section volumes."""
-    return _map_sections(sf.section_volume, neurite)
+    return sf.neurite_segment_features(neurite).section_volumes.tolist()
 
 
 @feature(shape=(...,))
 def section_areas(neurite):
     """Section areas."""
-    return _map_sections(sf.section_area, neurite)
+    return sf.neurite_segment_features(neurite).section_areas.tolist()
 
 
 @feature(shape=(...,))
@@ -458,4 +470,4 @@ def principal_direction_extents(neurite, direction=0):
 @feature(shape=(...,))
 def section_strahler_orders(neurite):
     """Inter-segment opening angles in a section."""
-    return _map_sections(sf.strahler_order, neurite)
+    return sf.strahler_orders(neurite).tolist()
@@ -28,22 +28,218 @@
 
 """Section functions and functional tools."""
 
+import functools
+import math
+from collections import namedtuple
+
 import numpy as np
 
 from neurom import morphmath as mm
 from neurom.core.dataformat import COLS
-from neurom.core.morphology import iter_segments
-from neurom.morphmath import interval_lengths
+from neurom.core.morphology import Section
+
+NeuriteSegmentFeatures = namedtuple('NeuriteSegmentFeatures',
+                                    ['section_lengths',
+                                     'section_areas',
+                                     'section_volumes',
+                                     'segment_lengths',
+                                     'segment_areas',
+                                     'segment_volumes',
+                                     'segment_mean_radii',
+                                     'segment_midpoints'])
+
+
+def neurite_segment_features(neurite):
+    """Compute the segment-based features of all the sections of a neurite in one pass.
+
+    The points of all the sections are concatenated into a single ``(N, 4)`` array together
+    with the offsets delimiting each section, so that the segment lengths, areas, volumes,
+    mean radii and midpoints of the whole neurite are obtained with a handful of vectorized
+    operations instead of one small NumPy call per section. The per-section reductions
+    (length, area, volume) are then recovered from the cumulative sums of the segment values.
+
+    The sections are visited in pre-order, so the returned arrays follow the same ordering
+    as ``Section.ipreorder``, with the segment values of each section laid out contiguously.
+
+    Returns:
+        NeuriteSegmentFeatures: a namedtuple of the per-section ``section_lengths``,
+        ``section_areas`` and ``section_volumes`` arrays and the flat per-segment
+        ``segment_lengths``, ``segment_areas``, ``segment_volumes``, ``segment_mean_radii``
+        and ``segment_midpoints`` arrays.
+    """
+    section_points_list = [s.points for s in neurite.root_node.ipreorder()]
+    offsets = np.cumsum([0] + [len(points) for points in section_points_list])
+    pts = np.concatenate(section_points_list).astype(np.float64)
+
+    diff = np.diff(pts, axis=0)
+    seg_len = np.linalg.norm(diff[:, COLS.XYZ], axis=1)
+    r0 = pts[:-1, COLS.R]
+    r1 = pts[1:, COLS.R]
+    seg_area = np.pi * (r0 + r1) * np.sqrt((r0 - r1) ** 2 + seg_len ** 2)
+    seg_vol = np.pi * seg_len * (r0 * r0 + r0 * r1 + r1 * r1) / 3.0
+    seg_mean_radii = 0.5 * (r0 + r1)
+    seg_midpoints = 0.5 * (pts[:-1, COLS.XYZ] + pts[1:, COLS.XYZ])
+
+    # rows of `diff` joining the last point of a section to the first point of the
+    # next one do not correspond to actual segments
+    boundaries = offsets[1:-1] - 1
+    valid = np.ones(len(seg_len), dtype=bool)
+    valid[boundaries] = False
+
+    # per-section sums as differences of cumulative sums; the zeroed boundary rows
+    # make each section's sum the sum of its own segments only
+    n_rows = len(seg_len)
+    starts = np.minimum(offsets[:-1], n_rows)
+    stops = np.minimum(offsets[1:], n_rows)
+
+    def _per_section_sums(segment_values):
+        segment_values = np.where(valid, segment_values, 0.0)
+        cumulative = np.concatenate(([0.0], np.cumsum(segment_values)))
+        return cumulative[stops] - cumulative[starts]
+
+    if mm.HAS_NUMBA:
+        # sections are independent, so reduce them in parallel across cores
+        sec_len, sec_area, sec_vol = mm.sections_scalar_stats(pts, offsets)
+    else:
+        sec_len = _per_section_sums(seg_len)
+        sec_area = _per_section_sums(seg_area)
+        sec_vol = _per_section_sums(seg_vol)
+
+    return NeuriteSegmentFeatures(section_lengths=sec_len,
+                                  section_areas=sec_area,
+                                  section_volumes=sec_vol,
+                                  segment_lengths=seg_len[valid],
+                                  segment_areas=seg_area[valid],
+                                  segment_volumes=seg_vol[valid],
+                                  segment_mean_radii=seg_mean_radii[valid],
+                                  segment_midpoints=seg_midpoints[valid])
+
+
+class SectionView:
+    """Lightweight per-section geometry buffers, filled lazily.
+
+    Accessing ``section.points`` crosses the MorphIO boundary and builds a fresh
+    (N, 4) array every time; most functions in this module need it (and quantities
+    derived from it, such as the segment lengths) more than once per analysis.
+    The view performs each copy and derivation at most once per section.
+
+    The buffers are shared by every caller, so they are marked read-only: in-place
+    arithmetic on a returned array raises instead of silently corrupting the cache.
+    """
+
+    __slots__ = ('points', '_soa', '_seg_len')
+
+    def __init__(self, points):
+        """Store the (N, 4) points array of the section."""
+        points.setflags(write=False)
+        self.points = points
+        self._soa = None
+        self._seg_len = None
+
+    @property
+    def xyz(self):
+        """The (x, y, z) columns of the points."""
+        return self.points[:, COLS.XYZ]
+
+    @property
+    def soa(self):
+        """The (x, y, z, r) columns as four contiguous 1-D buffers.
+
+        The row-major (N, 4) layout interleaves the coordinates, so column-wise
+        operations stride through memory. One transposed copy gives each axis a
+        contiguous vector that diffs and reductions auto-vectorize over cleanly.
+        """
+        if self._soa is None:
+            columns = np.ascontiguousarray(self.points.T)
+            columns.setflags(write=False)
+            self._soa = (columns[COLS.X], columns[COLS.Y],
+                         columns[COLS.Z], columns[COLS.R])
+        return self._soa
+
+    @property
+    def radii(self):
+        """The radius column of the points."""
+        return self.soa[3]
+
+    @property
+    def seg_len(self):
+        """The lengths of the segments joining consecutive points."""
+        if self._seg_len is None:
+            pts = self.points
+            if len(pts) == 2:
+                # single-segment sections are very common; a scalar sqrt avoids
+                # the whole diff/square/reduce machinery
+                dx = float(pts[1, COLS.X] - pts[0, COLS.X])
+                dy = float(pts[1, COLS.Y] - pts[0, COLS.Y])
+                dz = float(pts[1, COLS.Z] - pts[0, COLS.Z])
+                self._seg_len = np.array([math.sqrt(dx * dx + dy * dy + dz * dz)],
+                                         dtype=pts.dtype)
+            else:
+                x, y, z, _ = self.soa
+                self._seg_len = np.sqrt(
+                    np.diff(x) ** 2 + np.diff(y) ** 2 + np.diff(z) ** 2)
+            self._seg_len.setflags(write=False)
+        return self._seg_len
+
+
+# large enough for several big morphologies at once; bounded so that a run over a
+# whole population does not pin every morphology's points in memory for the
+# process lifetime (the cache key holds the section, hence its morphology)
+_VIEW_CACHE_SIZE = 32768
+
+
+@functools.lru_cache(maxsize=_VIEW_CACHE_SIZE)
+def _cached_view(section):
+    """Build the :class:`SectionView` of `section`, memoized on the section.
+
+    The cache relies on section equality, which for MorphIO-backed sections
+    identifies the underlying C++ section, so repeated ``Section`` wrappers of
+    the same section share one view.
+    """
+    return SectionView(section.points)
+
+
+def _view(section):
+    """Return the :class:`SectionView` of `section`, cached for ``Section`` objects.
+
+    Only genuine ``Section`` objects are memoized: other inputs accepted by the
+    functions of this module (e.g. a ``Neurite``) do not have an equality that
+    safely identifies their points across objects.
+    """
+    if isinstance(section, Section):
+        return _cached_view(section)
+    return SectionView(section.points)
+
+
+def invalidate_cache():
+    """Drop all the cached section views.
+
+    Called by the ``Section.points`` setter after a mutation, so that features never
+    keep reading the pre-mutation geometry; mutations that bypass the setter (e.g.
+    directly through MorphIO) must call it explicitly.
+    """
+    _cached_view.cache_clear()
 
 
 def section_points(section):
     """Returns the points in the section."""
-    return section.points[:, COLS.XYZ]
+    return _view(section).xyz
+
+
+def _total_length(sections):
+    """Summed length of `sections` computed with one concatenated reduction.
+
+    The cached segment lengths of the sections are concatenated and reduced by a
+    single ``np.sum`` instead of summing one small per-section NumPy result at a
+    time in the interpreter.
+    """
+    seg_lens = [_view(sec).seg_len for sec in sections]
+    return float(np.concatenate(seg_lens).sum(dtype=np.float64))
 
 
 def section_path_length(section):
     """Path length from section to root."""
-    return sum(s.length for s in section.iupstream())
+    return _total_length(section.iupstream())
 
 
 def section_length(section):
@@ -71,7 +267,7 @@ def section_tortuosity(section):
 
     If the section contains less than 2 points, the value 1 is returned.
     """
-    pts = section.points
+    pts = _view(section).points
     return 1 if len(pts) < 2 else mm.section_length(pts) / mm.point_dist(pts[-1], pts[0])
 
 
@@ -83,7 +279,7 @@ def section_end_distance(section):
 
     If the section contains less than 2 points, the value 0 is returned.
     """
-    pts = section.points
+    pts = _view(section).points
     return 0 if len(pts) < 2 else mm.point_dist(pts[-1], pts[0])
 
 
@@ -99,10 +295,18 @@ def branch_order(section):
 
 
 def taper_rate(section):
-    """Taper rate from fit along a section."""
-    pts = section.points
-    path_distances = np.cumsum(interval_lengths(pts, prepend_zero=True))
-    return np.polynomial.polynomial.polyfit(path_distances, 2.0 * pts[:, COLS.R], 1)[1]
+    """Taper rate from fit along a section.
+
+    The rate is the slope of the least-squares linear fit of the diameters along the
+    path distances, computed with the closed-form formula rather than a degree-1
+    ``polyfit``, which would build a Vandermonde matrix and solve a least-squares
+    system only to recover the same slope.
+    """
+    view = _view(section)
+    x = np.insert(np.cumsum(view.seg_len, dtype=np.float64), 0, 0.0)
+    y = 2.0 * view.radii.astype(np.float64)
+    dx = x - x.mean()
+    return np.dot(dx, y - y.mean()) / np.dot(dx, dx)
 
 
 def number_of_segments(section):
@@ -112,37 +316,46 @@ def number_of_segments(section):
 
 def segment_lengths(section, prepend_zero=False):
     """Returns the list of segment lengths within the section."""
-    return interval_lengths(section.points, prepend_zero=prepend_zero)
+    seg_len = _view(section).seg_len
+    if prepend_zero:
+        return np.insert(seg_len, 0, 0)
+    return seg_len
 
 
 def segment_areas(section):
-    """Returns the list of segment areas within the section."""
-    return [mm.segment_area(seg) for seg in iter_segments(section)]
+    """Returns the array of segment areas within the section."""
+    view = _view(section)
+    seg_len = view.seg_len.astype(np.float64)
+    r0 = view.radii[:-1].astype(np.float64)
+    r1 = view.radii[1:].astype(np.float64)
+    return np.pi * (r0 + r1) * np.sqrt((r0 - r1) ** 2 + seg_len ** 2)
 
 
 def segment_volumes(section):
-    """Returns the list of segment volumes within the section."""
-    return [mm.segment_volume(seg) for seg in iter_segments(section)]
+    """Returns the array of segment volumes within the section."""
+    view = _view(section)
+    seg_len = view.seg_len.astype(np.float64)
+    r0 = view.radii[:-1].astype(np.float64)
+    r1 = view.radii[1:].astype(np.float64)
+    return np.pi * seg_len * (r0 * r0 + r0 * r1 + r1 * r1) / 3.0
 
 
 def segment_mean_radii(section):
-    """Returns the list of segment mean radii within the section."""
-    pts = section.points[:, COLS.R]
-    return np.divide(np.add(pts[:-1], pts[1:]), 2.0).tolist()
+    """Returns the array of segment mean radii within the section."""
+    pts = _view(section).radii
+    return np.divide(np.add(pts[:-1], pts[1:]), 2.0)
 
 
 def segment_midpoints(section):
-    """Returns the list of segment midpoints within the section."""
-    pts = section.points[:, COLS.XYZ]
-    return np.divide(np.add(pts[:-1], pts[1:]), 2.0).tolist()
+    """Returns the array of segment midpoints within the section."""
+    pts = _view(section).xyz
+    return np.divide(np.add(pts[:-1], pts[1:]), 2.0)
 
 
 def segment_taper_rates(section):
-    """Returns the list of segment taper rates within the section."""
-    pts = section.points[:, COLS.XYZR]
-    diff = np.diff(pts, axis=0)
-    distance = np.linalg.norm(diff[:, COLS.XYZ], axis=1)
-    return np.divide(2.0 * diff[:, COLS.R], distance).tolist()
+    """Returns the array of segment taper rates within the section."""
+    view = _view(section)
+    return np.divide(2.0 * np.diff(view.radii), view.seg_len)
 
 
 def section_radial_distance(section, origin):
@@ -156,14 +369,45 @@ def section_radial_distance(section, origin):
         origin: point to which distances are measured. It must have at least 3\
             components. The first 3 components are (x, y, z).
     """
-    return mm.point_dist(section.points[-1], origin)
+    return mm.point_dist(_view(section).points[-1], origin)
 
 
 def section_meander_angles(section):
     """Inter-segment opening angles in a section."""
-    p = section.points
-    return [mm.angle_3points(p[i - 1], p[i - 2], p[i])
-            for i in range(2, len(p))]
+    p = _view(section).xyz.astype(np.float64)
+    if len(p) < 3:
+        return []
+    # angles between the vectors from each interior point to its two neighbours,
+    # computed for all interior points with a single arctan2 call
+    vec1 = p[:-2] - p[1:-1]
+    vec2 = p[2:] - p[1:-1]
+    cross = np.cross(vec1, vec2)
+    dot = np.einsum('ij,ij->i', vec1, vec2)
+    return np.arctan2(np.linalg.norm(cross, axis=1), dot).tolist()
+
+
+def _strahler_orders(root):
+    """Strahler orders of all the sections of the tree rooted at `root`.
+
+    The orders are computed iteratively in a single post-order traversal, so that
+    the order of each section is derived exactly once from the already known orders
+    of its children.
+
+    Returns:
+        dict: section id -> Strahler order.
+    """
+    orders = {}
+    for sec in root.ipostorder():
+        child_orders = [orders[child.id] for child in sec.children]
+        if child_orders:
+            max_so_children = max(child_orders)
+            if child_orders.count(max_so_children) >= 2:
+                orders[sec.id] = max_so_children + 1
+            else:
+                orders[sec.id] = max_so_children
+        else:
+            orders[sec.id] = 1
+    return orders
 
 
 def strahler_order(section):
@@ -183,36 +427,38 @@ def strahler_order(section):
        - If the node has two or more children with Strahler number i, and no
          children with greater number, then the Strahler number of the node is
          i + 1.
+    """
+    return _strahler_orders(section)[section.id]
+
+
+def strahler_orders(neurite):
+    """Strahler orders of all the sections of a neurite.
+
+    The whole tree is traversed once, so this is O(N) in the number of sections,
+    unlike mapping :func:`strahler_order` over each section which recomputes the
+    orders of every subtree.
 
-    No efforts have been invested in making it computationnaly efficient, but
-    it computes acceptably fast on tested morphologies (i.e., no waiting time).
+    Returns:
+        np.ndarray: the orders, following the ``Section.ipreorder`` section ordering.
     """
-    if section.children:
-        child_orders = [strahler_order(child) for child in section.children]
-        max_so_children = max(child_orders)
-        it = iter(co == max_so_children for co in child_orders)
-        #  check if there are *two* or more children w/ the max_so_children
-        any(it)
-        if any(it):
-            return max_so_children + 1
-        return max_so_children
-    return 1
+    orders = _strahler_orders(neurite.root_node)
+    return np.array([orders[sec.id] for sec in neurite.root_node.ipreorder()])
 
 
 def locate_segment_position(section, fraction):
     """Segment ID / offset corresponding to a given fraction of section length."""
-    return mm.path_fraction_id_offset(section.points, fraction)
+    return mm.path_fraction_id_offset(_view(section).points, fraction)
 
 
 def section_mean_radius(section):
     """Compute the mean radius of a section weighted by segment lengths."""
-    radii = section.points[:, COLS.R]
-    points = section.points[:, COLS.XYZ]
-    lengths = np.linalg.norm(points[1:] - points[:-1], axis=1)
+    view = _view(section)
+    radii = view.radii
+    lengths = view.seg_len
     mean_radii = 0.5 * (radii[1:] + radii[:-1])
-    return np.sum(mean_radii * lengths) / np.sum(lengths)
+    return np.dot(mean_radii, lengths) / np.sum(lengths)
 
 
 def downstream_pathlength(section):
     """Compute the total downstream length starting from a section."""
-    return sum(sec.length for sec in section.ipreorder())
+    return _total_length(section.ipreorder())
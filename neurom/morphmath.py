@@ -27,6 +27,7 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 """Mathematical and geometrical functions used to compute morphometrics."""
+import importlib.util
 import math
 import logging
 from itertools import combinations
@@ -38,10 +39,162 @@ from scipy.spatial.distance import cdist
 
 from neurom.core.dataformat import COLS
 
+# importing numba costs several hundred milliseconds, so it is deferred to the
+# first kernel call; until then only its availability is probed
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+prange = range
+
 
 L = logging.getLogger(__name__)
 
 
+def _section_scalar_stats_loop(pts):
+    """Single fused loop over the points of a section.
+
+    Compiled with numba when it is available; see :func:`section_scalar_stats`.
+    """
+    length = 0.0
+    area = 0.0
+    volume = 0.0
+    for i in range(len(pts) - 1):
+        dx = pts[i + 1, 0] - pts[i, 0]
+        dy = pts[i + 1, 1] - pts[i, 1]
+        dz = pts[i + 1, 2] - pts[i, 2]
+        seg_len = math.sqrt(dx * dx + dy * dy + dz * dz)
+        r0 = pts[i, 3]
+        r1 = pts[i + 1, 3]
+        length += seg_len
+        area += math.pi * (r0 + r1) * math.sqrt((r0 - r1) ** 2 + seg_len * seg_len)
+        volume += math.pi * seg_len * (r0 * r0 + r0 * r1 + r1 * r1) / 3.0
+    return length, area, volume
+
+
+def _section_scalar_stats_numpy(pts):
+    """Vectorized equivalent of the fused loop, used when numba is not installed."""
+    diff = np.diff(pts[:, COLS.XYZ], axis=0)
+    seg_len = np.linalg.norm(diff, axis=1)
+    r0 = pts[:-1, COLS.R]
+    r1 = pts[1:, COLS.R]
+    area = np.pi * (r0 + r1) * np.sqrt((r0 - r1) ** 2 + seg_len ** 2)
+    volume = np.pi * seg_len * (r0 * r0 + r0 * r1 + r1 * r1) / 3.0
+    return seg_len.sum(), area.sum(), volume.sum()
+
+
+def _sections_scalar_stats_loop(pts, offsets):
+    """Fused per-section loop over concatenated points, parallel across sections.
+
+    Compiled with numba when it is available; see :func:`sections_scalar_stats`.
+    """
+    n_sections = len(offsets) - 1
+    stats = np.zeros((3, n_sections))
+    for i in prange(n_sections):  # pylint: disable=not-an-iterable
+        length = 0.0
+        area = 0.0
+        volume = 0.0
+        for j in range(offsets[i], offsets[i + 1] - 1):
+            dx = pts[j + 1, 0] - pts[j, 0]
+            dy = pts[j + 1, 1] - pts[j, 1]
+            dz = pts[j + 1, 2] - pts[j, 2]
+            seg_len = math.sqrt(dx * dx + dy * dy + dz * dz)
+            r0 = pts[j, 3]
+            r1 = pts[j + 1, 3]
+            length += seg_len
+            area += math.pi * (r0 + r1) * math.sqrt((r0 - r1) ** 2 + seg_len * seg_len)
+            volume += math.pi * seg_len * (r0 * r0 + r0 * r1 + r1 * r1) / 3.0
+        stats[0, i] = length
+        stats[1, i] = area
+        stats[2, i] = volume
+    return stats
+
+
+def _sections_scalar_stats_numpy(pts, offsets):
+    """Sequential fallback of the per-section stats, used when numba is not installed."""
+    n_sections = len(offsets) - 1
+    stats = np.empty((3, n_sections))
+    for i in range(n_sections):
+        stats[:, i] = _section_scalar_stats_numpy(pts[offsets[i]:offsets[i + 1]])
+    return stats
+
+
+_section_scalar_stats = None
+_sections_scalar_stats = None
+
+
+def _init_section_scalar_stats_kernel():
+    """Select (and with numba, compile) the single-section kernel on first use."""
+    global _section_scalar_stats  # pylint: disable=global-statement
+    if HAS_NUMBA:
+        from numba import njit  # pragma: no cover  # pylint: disable=import-outside-toplevel
+        _section_scalar_stats = njit(cache=True)(_section_scalar_stats_loop)  # pragma: no cover
+    else:
+        _section_scalar_stats = _section_scalar_stats_numpy
+
+
+def _init_sections_scalar_stats_kernel():
+    """Select (and with numba, compile) the multi-section kernel on first use.
+
+    Compiled separately from the single-section kernel because ``parallel=True``
+    loads numba's parallel threading runtime: single-section callers must not pay
+    that compile nor arm that runtime.
+    """
+    global _sections_scalar_stats, prange  # pylint: disable=global-statement
+    if HAS_NUMBA:
+        # pylint: disable=import-outside-toplevel
+        import numba  # pragma: no cover
+        from numba import njit, prange  # pragma: no cover
+        # numba's auto-selected TBB threading layer is not fork-safe and deadlocks
+        # interpreter shutdown when multiprocessing is used in the same process
+        # (as neurom.apps.morph_stats does); default to the fork-safe workqueue,
+        # unless a layer was chosen via NUMBA_THREADING_LAYER or numba.config
+        if numba.config.THREADING_LAYER == 'default':  # pragma: no cover
+            numba.config.THREADING_LAYER = 'workqueue'  # pragma: no cover
+        _sections_scalar_stats = njit(cache=True, parallel=True, nogil=True)(  # pragma: no cover
+            _sections_scalar_stats_loop)
+    else:
+        _sections_scalar_stats = _sections_scalar_stats_numpy
+
+
+def section_scalar_stats(pts):
+    """Compute the length, area and volume of a section in a single pass.
+
+    The area and volume approximate each segment as a conical frustum, exactly like
+    :func:`segment_area` and :func:`segment_volume`, but all three reductions are fused
+    into one traversal of the points instead of one call per segment. The loop is JIT
+    compiled when numba is installed, and falls back to a vectorized NumPy version
+    otherwise.
+
+    Args:
+        pts: a (N, 4) array of (x, y, z, r) rows describing the section.
+
+    Returns:
+        tuple: (length, area, volume) of the section.
+    """
+    if _section_scalar_stats is None:
+        _init_section_scalar_stats_kernel()
+    return _section_scalar_stats(np.asarray(pts, dtype=np.float64))
+
+
+def sections_scalar_stats(pts, offsets):
+    """Compute the lengths, areas and volumes of many sections at once.
+
+    Sections are independent, so with numba installed the fused per-section loop of
+    :func:`section_scalar_stats` is distributed across CPU cores with ``prange``;
+    otherwise the sections are reduced one at a time with the vectorized fallback.
+
+    Args:
+        pts: a (N, 4) array of the concatenated (x, y, z, r) points of all sections.
+        offsets: a (n_sections + 1,) array such that the points of section ``i`` are
+            ``pts[offsets[i]:offsets[i + 1]]``.
+
+    Returns:
+        np.ndarray: a (3, n_sections) array of the per-section lengths, areas and volumes.
+    """
+    if _sections_scalar_stats is None:
+        _init_sections_scalar_stats_kernel()
+    return _sections_scalar_stats(np.asarray(pts, dtype=np.float64),
+                                  np.asarray(offsets, dtype=np.int64))
+
+
 def vector(p1, p2):
     """Compute vector between two 3D points.
 
@@ -190,7 +190,8 @@ def plot_soma(soma, ax=None, plane='xy',
     color = _get_color(color, tree_type=NeuriteType.soma)
 
     if isinstance(soma, SomaCylinders):
-        for start, end in zip(soma.points, soma.points[1:]):
+        points = soma.points
+        for start, end in zip(points, points[1:]):
             matplotlib_utils.project_cylinder_onto_2d(
                 ax, (plane0, plane1),
                 start=start[COLS.XYZ], end=end[COLS.XYZ],
@@ -307,7 +308,8 @@ def plot_soma3d(soma, ax=None, color=None, alpha=_ALPHA):
     color = _get_color(color, tree_type=NeuriteType.soma)
 
     if isinstance(soma, SomaCylinders):
-        for start, end in zip(soma.points, soma.points[1:]):
+        points = soma.points
+        for start, end in zip(points, points[1:]):
             matplotlib_utils.plot_cylinder(ax,
                                            start=start[COLS.XYZ], end=end[COLS.XYZ],
                                            start_radius=start[COLS.R], end_radius=end[COLS.R],
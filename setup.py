@@ -54,6 +54,7 @@ setup(
     name='neurom',
     extras_require={
         'plotly': ['plotly>=3.6.0', 'psutil>=5.5.1'],  # for plotly image saving
+        'numba': ['numba'],  # JIT-compiled morphometric kernels
         'docs': [
             'sphinx-bluebrain-theme',
             'sphinx-autorun',
@@ -211,6 +211,31 @@ def test_strahler_order():
     assert strahler_order == 4
 
 
+def test_strahler_order_counts_max_children():
+    # two leaf children with the max order increment the parent order
+    n = load_morphology(StringIO(u"""((CellBody) (-1 0 0 2) (1 0 0 2))
+    ((Dendrite)
+    (0 0 0 2)
+    (1 0 0 2)
+    (
+     (1 1 0 2)
+     |
+     (1 -1 0 2)
+    ))"""), reader='asc')
+    root = n.neurites[0].root_node
+    assert section.strahler_order(root) == 2
+    assert [section.strahler_order(child) for child in root.children] == [1, 1]
+
+
+def test_strahler_orders():
+    path = Path(SWC_PATH, 'strahler.swc')
+    n = load_morphology(path)
+    neurite = n.neurites[0]
+    orders = section.strahler_orders(neurite)
+    expected = [section.strahler_order(s) for s in neurite.root_node.ipreorder()]
+    npt.assert_array_equal(orders, expected)
+
+
 def test_locate_segment_position():
     s = load_morphology(StringIO(u"""((CellBody) (-1 0 0 2) (1 0 0 2))
     ((Dendrite)
@@ -239,3 +264,39 @@ def test_mean_radius():
     (6 4 4 400))"""), reader='asc')
 
     assert section.section_mean_radius(n.neurites[0]) == 100.
+
+
+def test_neurite_segment_features_with_and_without_numba(monkeypatch):
+    neurite = NRN.neurites[0]
+
+    monkeypatch.setattr(morphmath, 'HAS_NUMBA', False)
+    cumsum = section.neurite_segment_features(neurite)
+    monkeypatch.setattr(morphmath, 'HAS_NUMBA', True)
+    parallel = section.neurite_segment_features(neurite)
+
+    for plain, accelerated in zip(cumsum, parallel):
+        npt.assert_allclose(plain, accelerated)
+
+
+def test_set_points_invalidates_view_cache():
+    s = load_morphology(StringIO(u"""((CellBody) (-1 0 0 2) (1 0 0 2))
+    ((Dendrite)
+    (0 0 0 2)
+    (5 0 0 2))"""), reader='asc').sections[SECTION_ID]
+
+    npt.assert_allclose(section.segment_lengths(s), [5.])
+    s.points = s.points * [10., 10., 10., 1.]
+    npt.assert_allclose(section.segment_lengths(s), [50.])
+
+
+def test_cached_buffers_are_read_only():
+    s = load_morphology(StringIO(u"""((CellBody) (-1 0 0 2) (1 0 0 2))
+    ((Dendrite)
+    (0 0 0 2)
+    (5 0 0 2))"""), reader='asc').sections[SECTION_ID]
+
+    with pytest.raises(ValueError):
+        section.segment_lengths(s)[:] = 0.
+    with pytest.raises(ValueError):
+        section.section_points(s)[:] = 0.
+    npt.assert_allclose(section.segment_lengths(s), [5.])
@@ -427,6 +427,47 @@ def test_segment_length():
     assert mm.segment_length(((0, 0, 0), (42, 0, 0))) == 42
 
 
+def test_section_scalar_stats():
+    pts = np.array([[0.0, 0.0, 0.0, 3.0],
+                    [2.0, 0.0, 0.0, 3.0],
+                    [4.0, 0.0, 0.0, 6.0]])
+
+    length, area, volume = mm.section_scalar_stats(pts)
+
+    assert_almost_equal(length, 4.0)
+    assert_almost_equal(area, mm.segment_area(pts[0:2]) + mm.segment_area(pts[1:3]))
+    assert_almost_equal(volume, mm.segment_volume(pts[0:2]) + mm.segment_volume(pts[1:3]))
+
+
+def test_section_scalar_stats_loop_matches_numpy():
+    # the un-jitted loop and the fallback must agree whether or not numba is installed
+    pts = uniform(low=0.1, high=10.0, size=(12, 4))
+    npt.assert_allclose(mm._section_scalar_stats_loop(pts),
+                        mm._section_scalar_stats_numpy(pts))
+
+
+def test_sections_scalar_stats():
+    pts = np.array([[0.0, 0.0, 0.0, 3.0],
+                    [2.0, 0.0, 0.0, 3.0],
+                    [0.0, 0.0, 0.0, 3.0],
+                    [2.0, 0.0, 0.0, 3.0],
+                    [4.0, 0.0, 0.0, 6.0]])
+    offsets = [0, 2, 5]
+
+    stats = mm.sections_scalar_stats(pts, offsets)
+
+    assert stats.shape == (3, 2)
+    npt.assert_allclose(stats[:, 0], mm.section_scalar_stats(pts[0:2]))
+    npt.assert_allclose(stats[:, 1], mm.section_scalar_stats(pts[2:5]))
+
+
+def test_sections_scalar_stats_loop_matches_numpy():
+    pts = uniform(low=0.1, high=10.0, size=(10, 4))
+    offsets = np.array([0, 2, 6, 10])
+    npt.assert_allclose(mm._sections_scalar_stats_loop(pts, offsets),
+                        mm._sections_scalar_stats_numpy(pts, offsets))
+
+
 def test_segment_radius():
     assert mm.segment_radius(((0, 0, 0, 4), (0, 0, 0, 6))) == 5
 
@@ -38,57 +38,81 @@ from neurom import stats as st
 import pytest
 from numpy.testing import assert_almost_equal
 
-np.random.seed(42)
-
 NORMAL_MU = 10.
 NORMAL_SIGMA = 1.0
-NORMAL = np.random.normal(NORMAL_MU, NORMAL_SIGMA, 1000)
 EXPON_LAMBDA = 10.
-EXPON = np.random.exponential(EXPON_LAMBDA, 1000)
 UNIFORM_MIN = -1.
 UNIFORM_MAX = 1.
-UNIFORM = np.random.uniform(UNIFORM_MIN, UNIFORM_MAX, 1000)
 
 
-def test_fit_normal_params():
-    fit_ = st.fit(NORMAL, 'norm')
+@pytest.fixture(scope='module')
+def distributions():
+    """Draw the reference samples once per module, only when a test needs them.
+
+    The samples are drawn in a fixed order from a fixed seed so that the
+    regression values below stay reproducible.
+    """
+    np.random.seed(42)
+    normal = np.random.normal(NORMAL_MU, NORMAL_SIGMA, 1000)
+    expon = np.random.exponential(EXPON_LAMBDA, 1000)
+    uniform = np.random.uniform(UNIFORM_MIN, UNIFORM_MAX, 1000)
+    return normal, expon, uniform
+
+
+@pytest.fixture(scope='module')
+def normal(distributions):
+    return distributions[0]
+
+
+@pytest.fixture(scope='module')
+def expon(distributions):
+    return distributions[1]
+
+
+@pytest.fixture(scope='module')
+def uniform(distributions):
+    return distributions[2]
+
+
+def test_fit_normal_params(normal):
+    fit_ = st.fit(normal, 'norm')
     assert_almost_equal(fit_.params[0], NORMAL_MU, 1)
     assert_almost_equal(fit_.params[1], NORMAL_SIGMA, 1)
 
-def test_fit_normal_dict():
-    fit_ = st.fit(NORMAL, 'norm')
+def test_fit_normal_dict(normal):
+    fit_ = st.fit(normal, 'norm')
     d = st.fit_results_to_dict(fit_, min_bound=-123, max_bound=123)
     assert_almost_equal(d['mu'], NORMAL_MU, 1)
     assert_almost_equal(d['sigma'], NORMAL_SIGMA, 1)
     assert_almost_equal(d['min'], -123, 1)
     assert_almost_equal(d['max'], 123, 1)
 
-def test_fit_normal_regression():
-    fit_ = st.fit(NORMAL, 'norm')
+def test_fit_normal_regression(normal):
+    fit_ = st.fit(normal, 'norm')
     assert_almost_equal(fit_.params[0], 10.019332055822, 12)
     assert_almost_equal(fit_.params[1], 0.978726207747, 12)
     assert_almost_equal(fit_.errs[0], 0.021479979161, 12)
     assert_almost_equal(fit_.errs[1], 0.7369569123250506, 12)
 
-def test_fit_default_is_normal():
-    fit0_ = st.fit(NORMAL)
-    fit1_ = st.fit(NORMAL, 'norm')
+def test_fit_default_is_normal(normal):
+    fit0_ = st.fit(normal)
+    fit1_ = st.fit(normal, 'norm')
     assert fit0_.params == fit1_.params
     assert fit0_.errs == fit1_.errs
 
 
-def test_optimal_distribution_normal():
-    optimal = st.optimal_distribution(NORMAL)
+def test_optimal_distribution_normal(normal):
+    optimal = st.optimal_distribution(normal)
     assert optimal.type == 'norm'
 
 
-def test_optimal_distribution_exponential():
-    optimal = st.optimal_distribution(EXPON)
+def test_optimal_distribution_exponential(expon):
+    optimal = st.optimal_distribution(expon)
     assert optimal.type == 'expon'
 
 
-def test_optimal_distribution_uniform():
-    optimal = st.optimal_distribution(UNIFORM)
+def test_optimal_distribution_uniform(uniform):
+    optimal = st.optimal_distribution(uniform)
     assert optimal.type == 'uniform'
 
 
@@ -182,10 +206,17 @@ def test_compare_two():
     results3 = st.compare_two(data, data_far, test=st.StatTests.ks)
     assert_almost_equal(results3.dist, 1.0)
 
-distr1 = np.ones(100)
-distr2 = 2*np.ones(100)
+@pytest.fixture(scope='module')
+def distr1():
+    return np.ones(100)
+
+
+@pytest.fixture(scope='module')
+def distr2():
+    return 2 * np.ones(100)
+
 
-def test_compare_two_ks():
+def test_compare_two_ks(distr1, distr2):
 
     results1 = st.compare_two(distr1, distr1, test=st.StatTests.ks)
     assert_almost_equal(results1.dist, 0.0, decimal=5)
@@ -195,13 +226,13 @@ def test_compare_two_ks():
     assert_almost_equal(results2.dist, 1.0, decimal=5)
     assert_almost_equal(results2.pvalue, 0.0, decimal=5)
 
-def test_compare_two_wilcoxon():
+def test_compare_two_wilcoxon(distr1, distr2):
 
     results2 = st.compare_two(distr1, distr2, test=st.StatTests.wilcoxon)
     assert_almost_equal(results2.dist, 0.0, decimal=5)
     assert_almost_equal(results2.pvalue, 0.0, decimal=5)
 
-def test_compare_two_ttest():
+def test_compare_two_ttest(distr1, distr2):
 
     results1 = st.compare_two(distr1, distr1, test=st.StatTests.ttest)
     assert np.isnan(results1.dist)